@@ -1,14 +1,32 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+import aiohttp
+import argparse
+from aiolimiter import AsyncLimiter
+import lxml.html
+from lxml import etree
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    # Optional faster parser for the services section; lxml is used without it
+    LexborHTMLParser = None
 import csv
-import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import gzip
+import hashlib
+import html
 import re
+from pathlib import Path
 
+# Live site, which clinic pages are fetched from
+SITE_URL = "https://www.myfootdr.com.au"
 # Base URL for the Wayback Machine
-BASE_URL = "https://web.archive.org/web/20250708180027/https://www.myfootdr.com.au"
+BASE_URL = f"https://web.archive.org/web/20250708180027/{SITE_URL}"
 
 # List of regions to scrape
-REGIONS = [
+REGIONS = (
     "sunshine-coast",
     "brisbane",
     "gold-coast",
@@ -20,62 +38,207 @@ REGIONS = [
     "western-australia",
     "northern-territory",
     "tasmania"
-]
+)
+
+# Australian state and territory codes, ordered by how many of the regions
+# above are in each so the address pattern usually matches its first alternative
+STATE_CODES = ('QLD', 'NSW', 'VIC', 'SA', 'WA', 'NT', 'TAS', 'ACT')
+
+# Maximum number of requests in flight at once, and the overall request rate
+# (requests per second) so the archive is not hammered
+MAX_CONCURRENT_REQUESTS = 8
+MAX_REQUESTS_PER_SECOND = 5
+
+# Keep-alive connection pool shared by every request, and the retry policy
+# for connection errors and transient HTTP statuses
+CONNECTION_POOL_SIZE = 16
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Statuses whose Retry-After header replaces the computed backoff
+RETRY_AFTER_STATUSES = {429, 503}
+
+# Output and cache files live next to this script
+PROJECT_DIR = Path(__file__).resolve().parent
+CSV_PATH = PROJECT_DIR / 'clinics.csv'
+# Wayback snapshots never change, so fetched archive pages are kept on disk
+# and reused by later runs. Delete the directory to force a refetch
+CACHE_DIR = PROJECT_DIR / 'cache'
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+}
+
+CSV_FIELDS = ['Name of Clinic', 'Address', 'Email', 'Phone', 'Services']
 
 # Manual overrides for addresses when automatic extraction fails or is noisy
 ADDRESS_OVERRIDES = {
     'Allsports Podiatry Noosa': 'Unit 4, 17 Sunshine Beach Rd\nNoosa QLD 4567'
 }
-def get_page_content(url):
-    """Fetch page content with retry logic"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-    }
+
+# The "Services Available" heading, and the first h3 of every article that
+# follows it before the next h2 (i.e. in the same section)
+SERVICES_HEADING_XPATH = etree.XPath('(//h2 | //h3)[contains(., "Services Available")][1]')
+SECTION_INDEX_XPATH = etree.XPath('count(preceding-sibling::h2)')
+SERVICE_TITLES_XPATH = etree.XPath('following-sibling::article[count(preceding-sibling::h2) = $section]/descendant::h3[1]')
+
+# Patterns used while parsing pages, compiled once at import time
+# Markup whose text get_text() never returned: comments (including conditional
+# comments), scripts and stylesheets
+NON_TEXT_RE = re.compile(r'<!--.*?-->|<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+TAG_RE = re.compile(r'<[^>]+>')
+# lxml rejects str input that starts with an XML declaration naming an encoding
+XML_DECLARATION_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+# Clinic slug anywhere in an href (not only at the end), excluding region pages
+SLUG_RE = re.compile(r'/our-clinics/(?!regions(?:/|$))([^/]+)(?:/|$)')
+# Each phone pattern is paired with the group holding the number
+PHONE_PATTERNS = [
+    (re.compile(r'Call\s+([\d\s\(\)\-\+]+)', re.IGNORECASE), 1),
+    (re.compile(r'[\(\s]?0[2-9][\d\s\(\)\-]{7,}'), 0),
+]
+# Characters stripped from a matched phone number: anything in the Latin-1
+# range that is not a digit, whitespace or one of ()-+. The phone patterns can
+# only capture digits and whitespace beyond that range
+PHONE_DELETE_TABLE = {
+    code: None for code in range(256)
+    if not (chr(code).isdecimal() or chr(code).isspace() or chr(code) in '()-+')
+}
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+# Pattern: optional unit prefix + number + street + suburb with state code + postcode.
+# Both street forms share the suburb/state/postcode tail, so it is matched once
+ADDRESS_RE = re.compile(
+    r'((?:(?:Unit|Suite|No|Lot)[\s\d\w\-]*,\s*\d+[\w\s\.]+(?:St|Street|Rd|Road|Ave|Avenue|Dr|Drive|Lane|Ln|Crescent|Cres|Court|Ct|Pl|Place|Bvd|Boulevard)\s+'
+    r'|\d+[\s\w\-]*(?:St|Street|Rd|Road|Ave|Avenue|Dr|Drive|Lane|Ln|Crescent|Cres|Court|Ct|Pl|Place|Bvd|Boulevard))'
+    r'[\w\s]+(?:' + '|'.join(STATE_CODES) + r')\s+\d{4})',
+    re.IGNORECASE,
+)
+WS_RE = re.compile(r'\s+')
+MD_LINK_RE = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+
+def get_cache_path(url):
+    """Path of the gzipped cache file for a URL"""
+    return CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.html.gz"
+
+def read_cached_page(url):
+    """Return the cached content for a URL, or None if it has not been cached"""
+    try:
+        with gzip.open(get_cache_path(url), 'rt', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def write_cached_page(url, content):
+    """Store page content in the disk cache"""
+    CACHE_DIR.mkdir(exist_ok=True)
+    path = get_cache_path(url)
+    # Write to a temporary file first so an interrupted run never leaves a truncated entry
+    tmp_path = path.with_suffix('.tmp')
+    with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=1) as f:
+        f.write(content)
+    tmp_path.replace(path)
+
+async def get_page_content(session, semaphore, limiter, url):
+    """Fetch page content, serving archived snapshots from the disk cache when available"""
+    cacheable = url.startswith(BASE_URL)
+    if cacheable:
+        content = read_cached_page(url)
+        if content is not None:
+            return content
+    
+    content = await fetch_with_retries(session, semaphore, limiter, url)
     
-    max_retries = 3
-    for attempt in range(max_retries):
+    if content is not None and cacheable:
+        write_cached_page(url, content)
+    return content
+
+def get_retry_after(response):
+    """Seconds to wait from a response's Retry-After header, or None if absent or invalid"""
+    retry_after = response.headers.get('Retry-After')
+    if not retry_after:
+        return None
+    if retry_after.strip().isdigit():
+        return int(retry_after)
+    # Otherwise the header is an HTTP date
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+async def fetch_with_retries(session, semaphore, limiter, url):
+    """Fetch page content, retrying connection errors and transient statuses with backoff"""
+    for attempt in range(MAX_RETRIES + 1):
+        delay = RETRY_BACKOFF * 2 ** attempt
         try:
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            return response.text
+            # Every attempt takes a request slot and a rate limit token; the
+            # backoff below runs after both are released
+            async with semaphore, limiter, session.get(url) as response:
+                if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    response.raise_for_status()
+                    return await response.text()
+                # Rate-limited or unavailable: honour the server's requested wait
+                if response.status in RETRY_AFTER_STATUSES:
+                    retry_after = get_retry_after(response)
+                    if retry_after is not None:
+                        delay = retry_after
+        except aiohttp.ClientResponseError as e:
+            print(f"  Error fetching URL {url}: {str(e)[:50]}")
+            return None
         except Exception as e:
-            if attempt < max_retries - 1:
-                time.sleep(1)
-            else:
+            if attempt == MAX_RETRIES:
                 print(f"  Error fetching URL {url}: {str(e)[:50]}")
                 return None
+        await asyncio.sleep(delay)
 
 def build_clinic_url(clinic_path):
-    """Build a properly formatted clinic URL"""
+    """Build a properly formatted clinic URL on the live site"""
     # Remove any extra /web/ parts
     clinic_path = clinic_path.lstrip('/')
-    return f"{BASE_URL}/{clinic_path}"
+    return f"{SITE_URL}/{clinic_path}"
 
-def extract_clinics_from_region(region_name):
+async def extract_clinics_from_region(session, semaphore, limiter, executor, region_name):
     """Extract all clinic links from a region page"""
     region_url = f"{BASE_URL}/our-clinics/regions/{region_name}/"
     print(f"Fetching region: {region_name}")
     
-    content = get_page_content(region_url)
+    content = await get_page_content(session, semaphore, limiter, region_url)
     if not content:
-        print(f"  Failed to fetch region page")
+        print(f"  Failed to fetch region page: {region_name}")
         return []
     
-    soup = BeautifulSoup(content, 'html.parser')
-    clinics = []
+    loop = asyncio.get_running_loop()
+    unique_clinics = await loop.run_in_executor(executor, parse_region_page, content)
+    print(f"  Found {len(unique_clinics)} clinics in {region_name}")
+    return unique_clinics
+
+def parse_html_document(content):
+    """Parse page HTML with lxml, dropping any XML declaration it would reject"""
+    return lxml.html.document_fromstring(XML_DECLARATION_RE.sub('', content, count=1))
+
+def get_stripped_text(element):
+    """Concatenate an element's text fragments with surrounding whitespace removed"""
+    return ''.join(fragment.strip() for fragment in element.itertext())
+
+def parse_region_page(content):
+    """Collect the unique clinic links from a region page's HTML"""
+    tree = parse_html_document(content)
+    # Keyed by URL so duplicate links keep the first name seen, in page order
+    clinics = {}
     
     # Find all links that point to clinic pages
-    for link in soup.find_all('a', href=True):
+    for link in tree.iterfind('.//a[@href]'):
         href = link.get('href')
-        text = link.get_text(strip=True)
+        text = get_stripped_text(link)
 
         # If visible text is missing, try title/aria-label or nested headings
         if (not text or len(text) < 2):
             text = link.get('title') or link.get('aria-label') or ''
             if not text:
-                nested = link.find(['h2', 'h3', 'h4'])
-                if nested:
-                    text = nested.get_text(strip=True)
+                nested = next(link.iterdescendants('h2', 'h3', 'h4'), None)
+                if nested is not None:
+                    text = get_stripped_text(nested)
 
         if not href or not text or len(text) < 2:
             continue
@@ -85,48 +248,74 @@ def extract_clinics_from_region(region_name):
             continue
 
         # Check if it's a clinic page link. Wayback hrefs often include '/web/<ts>/https://...'
-        if '/our-clinics/' in href and '/regions/' not in href:
-            # Try to extract the slug anywhere in the href (not only at the end)
-            match = re.search(r'/our-clinics/([^/]+)/', href)
-            clinic_slug = None
-            if match:
-                clinic_slug = match.group(1)
-            else:
-                # Fallback: extract text after the last '/our-clinics/' and take first segment
-                try:
-                    tail = href.split('/our-clinics/')[-1]
-                    clinic_slug = tail.split('/')[0].strip()
-                except Exception:
-                    clinic_slug = None
-
+        match = SLUG_RE.search(href)
+        if match:
+            clinic_slug = match.group(1).strip()
             if clinic_slug:
-                prefix_to_remove = 'https://web.archive.org/web/20250708180027/'
                 clinic_url = build_clinic_url(f"our-clinics/{clinic_slug}/")
-                clinic_url = clinic_url.replace(prefix_to_remove, '')
-                clinics.append({'name': text, 'url': clinic_url})
+                clinics.setdefault(clinic_url, {'name': text, 'url': clinic_url})
     
-    # Remove duplicates
-    seen = set()
-    unique_clinics = []
-    for clinic in clinics:
-        if clinic['url'] not in seen:
-            seen.add(clinic['url'])
-            unique_clinics.append(clinic)
-    
-    print(f"  Found {len(unique_clinics)} clinics")
-    return unique_clinics
+    return list(clinics.values())
 
-def extract_clinic_details(clinic_url, clinic_name):
+async def extract_clinic_details(session, semaphore, limiter, executor, clinic_url, clinic_name):
     """Extract details from a clinic page"""
     try:
-        content = get_page_content(clinic_url)
+        content = await get_page_content(session, semaphore, limiter, clinic_url)
     except Exception as e:
         print(f"  Error fetching clinic page: {str(e)[:50]}")
         return None
+    if not content:
+        return None
+    
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, parse_clinic_page, content, clinic_name)
+
+def find_service_titles(content):
+    """Titles of the services listed under a page's "Services Available" heading"""
+    if LexborHTMLParser is not None:
+        return find_service_titles_lexbor(content)
+    return find_service_titles_lxml(content)
+
+def find_service_titles_lexbor(content):
+    """Service titles found with selectolax's Lexbor parser"""
+    tree = LexborHTMLParser(content)
+    
+    # Find the "Services Available" heading (h2 containing "Services Available")
+    services_heading = next(
+        (heading for heading in tree.css('h2, h3') if 'Services Available' in heading.text()), None
+    )
+    if services_heading is None:
+        return []
     
+    # Take the first h3 of each article that follows, stopping at the next h2 (new section)
+    titles = []
+    current = services_heading.next
+    while current is not None and current.tag != 'h2':
+        if current.tag == 'article':
+            h3 = current.css_first('h3')
+            if h3 is not None:
+                titles.append(h3.text(separator='', strip=True))
+        current = current.next
+    return titles
+
+def find_service_titles_lxml(content):
+    """Service titles found with lxml, used when selectolax is not installed"""
+    tree = parse_html_document(content)
+    
+    services_heading = SERVICES_HEADING_XPATH(tree)
+    if not services_heading:
+        return []
+    services_heading = services_heading[0]
+    # Articles in the same section have the same number of preceding h2 siblings
+    section = int(SECTION_INDEX_XPATH(services_heading)) + (services_heading.tag == 'h2')
+    return [get_stripped_text(h3) for h3 in SERVICE_TITLES_XPATH(services_heading, section=section)]
+
+def parse_clinic_page(content, clinic_name):
+    """Extract the clinic details from a clinic page's HTML"""
     try:
-        soup = BeautifulSoup(content, 'html.parser')
-        text_content = soup.get_text()
+        # Contact details are matched against the tag-stripped page text; only
+        # the services section needs a parsed tree
+        text_content = html.unescape(TAG_RE.sub(' ', NON_TEXT_RE.sub(' ', content)))
     except Exception as e:
         print(f"  Error parsing clinic page HTML: {str(e)[:50]}")
         return None
@@ -140,75 +329,44 @@ def extract_clinic_details(clinic_url, clinic_name):
     }
     
     # Extract phone number
-    phone_patterns = [
-        r'Call\s+([\d\s\(\)\-\+]+)',
-        r'[\(\s]?0[2-9][\d\s\(\)\-]{7,}',
-    ]
-    
-    for pattern in phone_patterns:
-        phone_match = re.search(pattern, text_content, re.IGNORECASE)
+    for pattern, group in PHONE_PATTERNS:
+        phone_match = pattern.search(text_content)
         if phone_match:
-            phone_text = phone_match.group(1) if '(' in pattern else phone_match.group(0)
-            phone_clean = re.sub(r'[^\d\s\(\)\-\+]', '', phone_text).strip()
+            phone_text = phone_match.group(group)
+            phone_clean = phone_text.translate(PHONE_DELETE_TABLE).strip()
             if phone_clean and len(phone_clean) > 5:
                 details['Phone'] = phone_clean
                 break
     
     # Extract email
-    email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text_content)
+    email_match = EMAIL_RE.search(text_content) if '@' in text_content else None
     if email_match:
         details['Email'] = email_match.group(0)
     
     # Extract address - use stricter pattern to find street + suburb + state + postcode
-    # Pattern: unit/number + street + suburb line with state code + postcode
-    address_patterns = [
-        r'((?:Unit|Suite|No|Lot)[\s\d\w\-]*,\s*\d+[\w\s\.]+(?:St|Street|Rd|Road|Ave|Avenue|Dr|Drive|Lane|Ln|Crescent|Cres|Court|Ct|Pl|Place|Bvd|Boulevard)\s+[\w\s]+(?:QLD|NSW|VIC|WA|SA|NT|TAS|ACT)\s+\d{4})',
-        r'(\d+[\s\w\-]*(?:St|Street|Rd|Road|Ave|Avenue|Dr|Drive|Lane|Ln|Crescent|Cres|Court|Ct|Pl|Place|Bvd|Boulevard)[\w\s]+(?:QLD|NSW|VIC|WA|SA|NT|TAS|ACT)\s+\d{4})',
-    ]
-    
     addr_text = ''
     
-    # First try to find address in the full text with any of the patterns
-    for pattern in address_patterns:
-        address_match = re.search(pattern, text_content, re.IGNORECASE)
-        if address_match:
-            addr_text = address_match.group(1).strip()
-            # Normalize newlines and multiple spaces
-            addr_text = re.sub(r'\s+', ' ', addr_text)
-            break
+    address_match = ADDRESS_RE.search(text_content)
+    if address_match:
+        addr_text = address_match.group(1).strip()
+        # Normalize newlines and multiple spaces
+        addr_text = WS_RE.sub(' ', addr_text)
     
     details['Address'] = addr_text
     
-    # Extract services from the "Services Available" section
+    # Extract services from the "Services Available" section. A page that
+    # fails to parse still keeps the contact details found above
     services = []
-    
-    # Find the "Services Available" heading (h2 containing "Services Available")
-    services_heading = None
-    for heading in soup.find_all(['h2', 'h3']):
-        if 'Services Available' in heading.get_text():
-            services_heading = heading
-            break
-    
-    if services_heading:
-        # Extract services from article elements that follow
-        current = services_heading.find_next_sibling()
-        while current:
-            # Stop if we hit another h2 (new section)
-            if current.name == 'h2':
-                break
-            
-            # Look for article elements containing service info
-            if current.name == 'article':
-                # Try to find h3 heading inside the article
-                h3 = current.find('h3')
-                if h3:
-                    service_text = h3.get_text(strip=True)
-                    # Remove markdown link syntax like [Text](url) leaving just Text
-                    service_text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', service_text)
-                    if service_text and len(service_text) > 2:
-                        services.append(service_text)
-            
-            current = current.find_next_sibling()
+    try:
+        service_titles = find_service_titles(content)
+    except Exception as e:
+        print(f"  Error parsing services section: {str(e)[:50]}")
+        service_titles = []
+    for service_text in service_titles:
+        # Remove markdown link syntax like [Text](url) leaving just Text
+        service_text = MD_LINK_RE.sub(r'\1', service_text)
+        if service_text and len(service_text) > 2:
+            services.append(service_text)
     
     details['Services'] = ', '.join(services) if services else ''
     
@@ -219,59 +377,92 @@ def extract_clinic_details(clinic_url, clinic_name):
     
     return details
 
-def scrape_all_clinics():
+def read_processed_clinics(csv_file):
+    """Names of the clinics already saved in a previous run's CSV"""
+    try:
+        with open(csv_file, newline='', encoding='utf-8') as f:
+            return {row['Name of Clinic'] for row in csv.DictReader(f)}
+    except FileNotFoundError:
+        return set()
+
+async def scrape_all_clinics(resume=False):
     """Main scraping function"""
     print("Starting clinic data scraper...\n")
-    all_clinics = []
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    limiter = AsyncLimiter(MAX_REQUESTS_PER_SECOND, time_period=1.0)
+    timeout = aiohttp.ClientTimeout(total=15)
+    connector = aiohttp.TCPConnector(limit=CONNECTION_POOL_SIZE, keepalive_timeout=30)
     
-    # Collect all clinics from all regions
-    for region in REGIONS:
-        try:
-            clinics = extract_clinics_from_region(region)
-            all_clinics.extend(clinics)
-            time.sleep(0.5)
-        except Exception as e:
-            print(f"  Error in region {region}: {str(e)[:50]}")
-    
-    print(f"\n\nTotal clinics discovered: {len(all_clinics)}")
-    print(f"all_clinics links: {all_clinics}\n")
-    print("Now fetching individual clinic details...\n")
-    
-    # Extract details from each clinic
-    clinic_data = []
-    successful = 0
-    failed = 0
+    # Parsing is CPU-bound, so it runs in worker processes (one per CPU) to
+    # use every core and keep the event loop free for network I/O
+    with ProcessPoolExecutor() as executor:
+        async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout, connector=connector) as session:
+            # Collect all clinics from all regions
+            region_results = await asyncio.gather(
+                *(extract_clinics_from_region(session, semaphore, limiter, executor, region) for region in REGIONS),
+                return_exceptions=True,
+            )
+            all_clinics = []
+            for region, result in zip(REGIONS, region_results):
+                if isinstance(result, Exception):
+                    print(f"  Error in region {region}: {str(result)[:50]}")
+                else:
+                    all_clinics.extend(result)
+            
+            print(f"\n\nTotal clinics discovered: {len(all_clinics)}")
+            print(f"all_clinics links: {all_clinics}\n")
+            
+            # When resuming, skip clinics a previous run already wrote to the CSV
+            processed = read_processed_clinics(CSV_PATH) if resume else set()
+            if processed:
+                all_clinics = [clinic for clinic in all_clinics if clinic['name'] not in processed]
+                print(f"Resuming: {len(processed)} clinics already saved, {len(all_clinics)} remaining\n")
+            print("Now fetching individual clinic details...\n")
+            
+            # Rows are written as soon as each clinic is scraped, so an interrupted
+            # run keeps its progress and can be resumed. The file is only opened
+            # once a clinic succeeds, so a run that scrapes nothing leaves the
+            # previous CSV untouched
+            with ExitStack() as stack:
+                f = writer = None
+                
+                def write_row(details):
+                    nonlocal f, writer
+                    if writer is None:
+                        f = stack.enter_context(open(CSV_PATH, 'a' if processed else 'w', newline='', encoding='utf-8', buffering=1 << 20))
+                        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+                        if not processed:
+                            writer.writeheader()
+                    writer.writerow(details)
+                    f.flush()
+                
+                # Extract details from each clinic
+                async def fetch_details(i, clinic):
+                    details = await extract_clinic_details(session, semaphore, limiter, executor, clinic['url'], clinic['name'])
+                    clinic_name_short = clinic['name'][:45] if len(clinic['name']) > 45 else clinic['name']
+                    # Include clinics even with partial data - just need at least one contact detail
+                    if details:
+                        write_row(details)
+                    print(f"[{i:>3}/{len(all_clinics)}] {clinic_name_short:<47} {'✓' if details else '✗'}", flush=True)
+                    return details
+                
+                results = await asyncio.gather(*(fetch_details(i, clinic) for i, clinic in enumerate(all_clinics, 1)))
     
-    for i, clinic in enumerate(all_clinics, 1):
-        clinic_name_short = clinic['name'][:45] if len(clinic['name']) > 45 else clinic['name']
-        print(f"[{i:>3}/{len(all_clinics)}] {clinic_name_short:<47}", end=' ', flush=True)
-        
-        details = extract_clinic_details(clinic['url'], clinic['name'])
-        # Include clinics even with partial data - just need at least one contact detail
-        if details:
-            clinic_data.append(details)
-            successful += 1
-            print("✓")
-        else:
-            failed += 1
-            print("✗")
-        
-        time.sleep(0.3)
+    successful = sum(1 for details in results if details)
+    failed = len(results) - successful
     
-    # Save to CSV
-    csv_file = '/Users/kittubittu/Documents/clinic-data-scraper/clinics.csv'
-    if clinic_data:
-        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=['Name of Clinic', 'Address', 'Email', 'Phone', 'Services'])
-            writer.writeheader()
-            writer.writerows(clinic_data)
+    if successful or processed:
         print(f"\n\n{'='*60}")
         print(f"Successfully scraped data from {successful} clinics")
         print(f"Failed or incomplete: {failed} clinics")
-        print(f"Data saved to: {csv_file}")
+        print(f"Data saved to: {CSV_PATH}")
         print(f"{'='*60}")
     else:
         print("No clinic data found!")
 
 if __name__ == "__main__":
-    scrape_all_clinics()
+    parser = argparse.ArgumentParser(description="Scrape clinic details into a CSV")
+    parser.add_argument('--resume', action='store_true',
+                        help="append to the existing CSV, skipping clinics it already contains")
+    args = parser.parse_args()
+    asyncio.run(scrape_all_clinics(resume=args.resume))